@@ -0,0 +1,505 @@
+#!/usr/bin/env python3
+"""
+THub V2 Webhook API Harness
+Measurement modes for the app-side /api/webhooks/n8n endpoint
+
+Usage:
+    python3 test-webhook-api.py cold-start --gaps 0,300,900 --samples 3
+    python3 test-webhook-api.py contention --mix market_scan=1,batch_analyze:high=2,analyze=4
+
+Requires N8N_WEBHOOK_SECRET. The route allows 10 requests per minute per IP,
+so 429 responses are expected when short gaps are combined with many actions.
+"""
+
+import argparse
+import itertools
+import json
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# ANSI color codes
+class Colors:
+    GREEN = '\033[92m'
+    RED = '\033[91m'
+    YELLOW = '\033[93m'
+    BLUE = '\033[94m'
+    RESET = '\033[0m'
+
+# THub V2 app base URL (production: the Vercel deployment URL)
+API_BASE_URL = os.environ.get("THUB_API_URL", "http://localhost:3000")
+WEBHOOK_PATH = "/api/webhooks/n8n"
+WEBHOOK_SECRET = os.environ.get("N8N_WEBHOOK_SECRET", "")
+
+PAYLOADS_FILE = Path(__file__).resolve().parent / "test-payloads" / "market-scan-test.json"
+ACTIONS = ["analyze", "batch_analyze", "market_scan", "market_overview"]
+
+# Symbols for contention batches; analyzeBatch only calls waitIfNeeded
+# between its 10-symbol chunks, so waits need batches larger than 10
+BATCH_UNIVERSE = [
+    "AAPL", "MSFT", "GOOGL", "AMZN", "NVDA", "META", "TSLA", "AVGO", "JPM", "V",
+    "UNH", "XOM", "MA", "JNJ", "PG", "HD", "COST", "ABBV", "MRK", "CVX",
+    "CRM", "BAC", "KO", "PEP", "AMD", "NFLX", "ADBE", "TMO", "WMT", "LIN",
+    "MCD", "CSCO", "ACN", "ABT", "ORCL", "DHR", "INTC", "DIS", "WFC", "TXN",
+    "VZ", "PM", "QCOM", "INTU", "IBM", "CAT", "AMGN", "GE", "NKE", "UPS"
+]
+MAX_BATCH_SYMBOLS = 50  # WebhookSchema symbols.max
+
+# Route-side init steps reported in response.instance.initTimings
+INIT_STEPS = ["rateLimiter", "cacheService", "coordinator"]
+
+def load_action_payloads() -> Dict[str, Dict]:
+    """Build one payload per webhook action from market-scan-test.json"""
+    with open(PAYLOADS_FILE) as f:
+        fixtures = json.load(f)
+
+    return {
+        "analyze": {"action": "analyze", "symbols": ["AAPL"]},
+        "batch_analyze": fixtures["batch_analysis_test"]["payload"],
+        "market_scan": fixtures["test_cases"][0]["payload"],
+        "market_overview": {"action": "market_overview"}
+    }
+
+def build_class_payload(workload_class: str, payloads: Dict[str, Dict]) -> Dict:
+    """Payload for an "action" or "action:priority" workload class"""
+    action, _, priority = workload_class.partition(":")
+    payload = json.loads(json.dumps(payloads[action]))
+    if priority:
+        payload["priority"] = priority
+    return payload
+
+def create_session(pool_size: int = 1, keep_alive: bool = True) -> requests.Session:
+    """Create an authenticated session for the webhook endpoint"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
+        "Authorization": f"Bearer {WEBHOOK_SECRET}",
+        "Content-Type": "application/json"
+    })
+    if not keep_alive:
+        session.headers["Connection"] = "close"
+    return session
+
+def post_action(session: requests.Session, base_url: str, payload: Dict, timeout: float,
+                headers: Optional[Dict] = None) -> Dict:
+    """POST one action and return status, client latency (s) and response body"""
+    start = time.perf_counter()
+    try:
+        response = session.post(f"{base_url}{WEBHOOK_PATH}", json=payload, timeout=timeout,
+                                headers=headers)
+        status = response.status_code
+        try:
+            body = response.json()
+        except ValueError:
+            body = {}
+    except requests.RequestException as e:
+        status = type(e).__name__
+        body = {}
+
+    return {
+        "action": payload.get("action"),
+        "status": status,
+        "latency": time.perf_counter() - start,
+        "body": body
+    }
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+def is_ok(result: Dict) -> bool:
+    return isinstance(result["status"], int) and 200 <= result["status"] < 300
+
+def parse_list(value: str) -> List[str]:
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+# ---------------------------------------------------------------------------
+# Cold-start mode
+# ---------------------------------------------------------------------------
+
+def classify_cold(result: Dict, warm_baseline: Optional[float], threshold: float) -> str:
+    """Classify a response as cold or warm
+
+    Server markers win: coldStart is set on the first successful request an
+    instance serves. Without markers (older deployments) fall back to timing
+    against the warm baseline for the action.
+    """
+    instance = result["body"].get("instance") if isinstance(result["body"], dict) else None
+    if instance:
+        return "cold" if instance.get("coldStart") else "warm"
+
+    if warm_baseline is not None and result["latency"] > warm_baseline * threshold:
+        return "cold?"
+    return "warm?"
+
+def run_cold_start(args: argparse.Namespace, actions: List[str], gaps: List[float]) -> bool:
+    """Space requests by idle gaps and report the cold-start latency distribution"""
+    print(f"{Colors.BLUE}{'=' * 60}")
+    print("THub V2 Webhook Cold-Start Measurement")
+    print('=' * 60 + Colors.RESET)
+
+    payloads = load_action_payloads()
+
+    print(f"Endpoint: {args.base_url}{WEBHOOK_PATH}")
+    print(f"Actions: {', '.join(actions)}")
+    print(f"Idle gaps (s): {', '.join(f'{g:g}' for g in gaps)}  Samples per gap: {args.samples}")
+
+    results: List[Dict] = []
+    warm_latencies: Dict[str, List[float]] = {action: [] for action in actions}
+
+    round_index = 0
+    for gap in gaps:
+        for sample in range(args.samples):
+            print(f"\n{Colors.YELLOW}Idle {gap:g}s (sample {sample + 1}/{args.samples}){Colors.RESET}")
+            time.sleep(gap)
+
+            # Rotate so every action gets to be the first request after the gap
+            offset = round_index % len(actions)
+            round_index += 1
+
+            for action in actions[offset:] + actions[:offset]:
+                # A fresh connection per request so keep-alive cannot pin a warm instance
+                session = create_session(keep_alive=False)
+                result = post_action(session, args.base_url, payloads[action], args.timeout)
+                session.close()
+
+                baseline = (statistics.median(warm_latencies[action])
+                            if warm_latencies[action] else None)
+                result["gap"] = gap
+                # Rejected (429/401/400) and failed responses say nothing about cold starts
+                if is_ok(result):
+                    result["kind"] = classify_cold(result, baseline, args.threshold)
+                else:
+                    result["kind"] = "error"
+                if result["kind"].startswith("warm"):
+                    warm_latencies[action].append(result["latency"])
+                results.append(result)
+
+                color = Colors.GREEN if is_ok(result) else Colors.RED
+                print(f"  {action:<16}{color}{result['status']!s:<6}{Colors.RESET}"
+                      f"{result['latency']:>8.3f}s  {result['kind']}")
+
+    report_cold_start(results, actions, gaps)
+    return all(isinstance(r["status"], int) and r["status"] < 500 for r in results)
+
+def report_cold_start(results: List[Dict], actions: List[str], gaps: List[float]) -> None:
+    """Print per-action cold vs warm distributions and init attribution (2xx only)"""
+    print(f"\n{Colors.BLUE}{'=' * 60}")
+    print("Cold-Start Latency by Action (seconds)")
+    print('=' * 60 + Colors.RESET)
+    print(f"{'ACTION':<17}{'KIND':<6}{'N':>4}{'P50':>8}{'P90':>8}{'MAX':>8}")
+
+    for action in actions:
+        for kind in ("cold", "warm"):
+            latencies = [r["latency"] for r in results
+                         if r["action"] == action and r["kind"].startswith(kind)]
+            if not latencies:
+                continue
+            print(f"{action:<17}{kind:<6}{len(latencies):>4}"
+                  f"{percentile(latencies, 50):>8.3f}{percentile(latencies, 90):>8.3f}"
+                  f"{max(latencies):>8.3f}")
+
+    print(f"\n{Colors.BLUE}Cold rate by idle gap (2xx only){Colors.RESET}")
+    for gap in gaps:
+        at_gap = [r for r in results if r["gap"] == gap and is_ok(r)]
+        cold = sum(1 for r in at_gap if r["kind"].startswith("cold"))
+        print(f"  {gap:>7g}s: {cold}/{len(at_gap)} cold")
+
+    errors: Dict[str, int] = {}
+    for r in results:
+        if not is_ok(r):
+            errors[str(r["status"])] = errors.get(str(r["status"]), 0) + 1
+    if errors:
+        print(f"\n{Colors.YELLOW}! {sum(errors.values())} non-2xx response(s) excluded: "
+              + ", ".join(f"{status}x{count}" for status, count in sorted(errors.items()))
+              + Colors.RESET)
+
+    print(f"\n{Colors.BLUE}Init attribution (server-reported, seconds){Colors.RESET}")
+    print(f"{'ACTION':<17}{'KIND':<6}" + "".join(f"{step:>14}" for step in INIT_STEPS)
+          + f"{'PENALTY':>10}{'INIT %':>8}")
+
+    for action in actions:
+        rows = {}
+        for kind in ("cold", "warm"):
+            timed = [r for r in results if r["action"] == action and r["kind"] == kind
+                     and r["body"].get("instance", {}).get("initTimings")]
+            if timed:
+                rows[kind] = {
+                    step: statistics.mean(r["body"]["instance"]["initTimings"].get(step, 0) / 1000
+                                          for r in timed)
+                    for step in INIT_STEPS
+                }
+                rows[kind]["latency"] = statistics.median(r["latency"] for r in timed)
+
+        for kind, row in rows.items():
+            line = f"{action:<17}{kind:<6}" + "".join(f"{row[step]:>14.4f}" for step in INIT_STEPS)
+            if kind == "cold" and "warm" in rows:
+                penalty = row["latency"] - rows["warm"]["latency"]
+                init_extra = sum(row[step] - rows["warm"][step] for step in INIT_STEPS)
+                share = (init_extra / penalty * 100) if penalty > 0 else 0.0
+                line += f"{penalty:>10.3f}{share:>7.1f}%"
+            print(line)
+
+    unmarked = sum(1 for r in results if r["kind"].endswith("?"))
+    if unmarked:
+        print(f"\n{Colors.YELLOW}! {unmarked} response(s) had no instance markers; "
+              f"classified by timing only (marked with ?){Colors.RESET}")
+
+# ---------------------------------------------------------------------------
+# Contention mode
+# ---------------------------------------------------------------------------
+
+def batch_size(value: str) -> int:
+    """argparse type for --batch-size"""
+    size = int(value)
+    if not 1 <= size <= MAX_BATCH_SYMBOLS:
+        raise argparse.ArgumentTypeError(f"must be between 1 and {MAX_BATCH_SYMBOLS}")
+    return size
+
+def parse_mix(value: str) -> Dict[str, int]:
+    """Parse "market_scan=1,batch_analyze:high=2" into class weights"""
+    mix = {}
+    for item in parse_list(value):
+        workload_class, _, weight = item.partition("=")
+        action = workload_class.split(":")[0]
+        if action not in ACTIONS:
+            raise ValueError(f"Unknown action '{action}' in mix")
+        try:
+            mix[workload_class] = int(weight or 1)
+        except ValueError:
+            raise ValueError(f"Weight for '{workload_class}' must be an integer, got '{weight}'")
+        if mix[workload_class] < 1:
+            raise ValueError(f"Weight for '{workload_class}' must be at least 1, got {weight}")
+    if not mix:
+        raise ValueError("Mix is empty")
+    return mix
+
+def build_schedule(mix: Dict[str, int], total: int) -> List[str]:
+    """Interleave classes by weight (smooth weighted round-robin)"""
+    current = {workload_class: 0 for workload_class in mix}
+    weight_sum = sum(mix.values())
+    schedule = []
+    for _ in range(total):
+        for workload_class, weight in mix.items():
+            current[workload_class] += weight
+        chosen = max(current, key=current.get)
+        current[chosen] -= weight_sum
+        schedule.append(chosen)
+    return schedule
+
+def jain_index(values: List[float]) -> float:
+    """Jain's fairness index: 1.0 when all values are equal, 1/n when one class gets everything"""
+    values = [v for v in values if v is not None]
+    if not values or not any(values):
+        return 0.0
+    return sum(values) ** 2 / (len(values) * sum(v * v for v in values))
+
+def rate_limit_info(result: Dict) -> Dict:
+    """Per-request limiter pressure reported by the route"""
+    return result["body"].get("apiUsage", {}).get("request", {}) if isinstance(result["body"], dict) else {}
+
+def run_contention(args: argparse.Namespace, mix: Dict[str, int]) -> bool:
+    """Run a weighted mix of actions concurrently against the shared singletons"""
+    print(f"{Colors.BLUE}{'=' * 60}")
+    print("THub V2 Webhook Mixed-Workload Contention Test")
+    print('=' * 60 + Colors.RESET)
+
+    payloads = load_action_payloads()
+    payloads["batch_analyze"]["symbols"] = BATCH_UNIVERSE[:args.batch_size]
+    classes = list(mix)
+
+    print(f"Endpoint: {args.base_url}{WEBHOOK_PATH}")
+    print(f"Mix: {', '.join(f'{c}={w}' for c, w in mix.items())}")
+    print(f"Requests: {args.requests}  Concurrency: {args.concurrency}  "
+          f"Batch size: {args.batch_size}")
+    if args.batch_size <= 10:
+        print(f"{Colors.YELLOW}! Batches of 10 or fewer symbols never reach waitIfNeeded; "
+              f"WAIT will be 0{Colors.RESET}")
+    if not args.spoof_ip:
+        print(f"{Colors.YELLOW}! Webhook limiter allows 10 requests/min per IP; "
+              f"use --spoof-ip against a local server{Colors.RESET}")
+
+    session = create_session(pool_size=args.concurrency)
+    request_counter = itertools.count(1)
+
+    def send(workload_class: str) -> Dict:
+        headers = None
+        if args.spoof_ip:
+            n = next(request_counter)
+            headers = {"X-Forwarded-For": f"10.{(n >> 16) & 255}.{(n >> 8) & 255}.{n & 255}"}
+        result = post_action(session, args.base_url, build_class_payload(workload_class, payloads),
+                             args.timeout, headers)
+        result["class"] = workload_class
+        return result
+
+    # Solo baseline: each class alone, sequentially
+    solo: Dict[str, List[float]] = {c: [] for c in classes}
+    if args.solo_samples:
+        print(f"\n{Colors.YELLOW}Solo baseline ({args.solo_samples} per class){Colors.RESET}")
+        for workload_class in classes:
+            for _ in range(args.solo_samples):
+                result = send(workload_class)
+                if result["status"] == 200:
+                    solo[workload_class].append(result["latency"])
+            if solo[workload_class]:
+                print(f"  {workload_class:<24}{statistics.median(solo[workload_class]):>8.3f}s")
+
+    # Mixed run
+    schedule = build_schedule(mix, args.requests)
+    print(f"\n{Colors.YELLOW}Mixed run{Colors.RESET}")
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        results = list(pool.map(send, schedule))
+    wall_time = time.perf_counter() - started
+    session.close()
+
+    report_contention(results, classes, solo, wall_time)
+    return all(isinstance(r["status"], int) and r["status"] < 500 for r in results)
+
+def report_contention(results: List[Dict], classes: List[str], solo: Dict[str, List[float]],
+                      wall_time: float) -> None:
+    """Print per-class latency, limiter pressure and fairness metrics"""
+    print(f"\n{Colors.BLUE}{'=' * 60}")
+    print("Per-Class Results (seconds)")
+    print('=' * 60 + Colors.RESET)
+    print(f"{'CLASS':<24}{'N':>4}{'OK':>5}{'429':>5}{'DENIED':>8}{'WAIT':>8}"
+          f"{'P50':>8}{'P95':>8}{'SLOWDN':>8}")
+
+    slowdowns: Dict[str, Optional[float]] = {}
+    served: Dict[str, float] = {}
+
+    for workload_class in classes:
+        samples = [r for r in results if r["class"] == workload_class]
+        ok = [r for r in samples if r["status"] == 200]
+        throttled = sum(1 for r in samples if r["status"] == 429)
+        denied = sum(1 for r in ok if rate_limit_info(r).get("denied", 0) > 0)
+        waits = [rate_limit_info(r).get("waitTime", 0) / 1000 for r in ok]
+        latencies = [r["latency"] for r in ok]
+
+        p50 = percentile(latencies, 50)
+        slowdown = (p50 / statistics.median(solo[workload_class])
+                    if latencies and solo.get(workload_class) else None)
+        slowdowns[workload_class] = slowdown
+        served[workload_class] = (len(ok) - denied) / len(samples) if samples else 0.0
+
+        print(f"{workload_class:<24}{len(samples):>4}{len(ok):>5}{throttled:>5}{denied:>8}"
+              f"{(statistics.mean(waits) if waits else 0):>8.3f}"
+              f"{p50:>8.3f}{percentile(latencies, 95):>8.3f}"
+              f"{(f'{slowdown:.2f}x' if slowdown else '-'):>8}")
+
+    print("WAIT is the waitIfNeeded delay between 10-symbol chunks, so it only applies "
+          "to batch_analyze classes")
+
+    print(f"\n{Colors.BLUE}Fairness (Jain's index, 1.0 = perfectly fair){Colors.RESET}")
+    print(f"  Service (served / requested): {jain_index(list(served.values())):.3f}")
+    if all(slowdowns.values()):
+        print(f"  Latency (1 / slowdown):       "
+              f"{jain_index([1 / s for s in slowdowns.values()]):.3f}")
+
+    by_priority: Dict[str, List[float]] = {}
+    for r in results:
+        action, _, priority = r["class"].partition(":")
+        if action == "batch_analyze" and r["status"] == 200:
+            by_priority.setdefault(priority or "default", []).append(r["latency"])
+    if len(by_priority) > 1:
+        print(f"\n{Colors.BLUE}batch_analyze by priority (p50 s){Colors.RESET}")
+        for priority, latencies in sorted(by_priority.items()):
+            print(f"  {priority:<10}{percentile(latencies, 50):>8.3f}")
+
+    last = next((r for r in reversed(results)
+                 if isinstance(r["body"], dict) and r["body"].get("apiUsage")), None)
+    if last:
+        contention = last["body"]["apiUsage"].get("contention", {})
+        print(f"\n{Colors.BLUE}Instance limiter counters (last response){Colors.RESET}")
+        print(f"  Denied checks: {contention.get('deniedChecks', 0)}  "
+              f"Waits: {contention.get('waits', 0)}  "
+              f"Total wait: {contention.get('totalWaitTime', 0) / 1000:.3f}s")
+
+    print(f"\nRequests: {len(results)}  Wall time: {wall_time:.3f}s")
+
+def main() -> bool:
+    parser = argparse.ArgumentParser(description="THub V2 /api/webhooks/n8n measurement harness")
+    parser.add_argument("--base-url", default=API_BASE_URL, help="app base URL")
+    parser.add_argument("--timeout", type=float, default=60, help="per-request timeout in seconds")
+    modes = parser.add_subparsers(dest="mode", required=True)
+
+    cold = modes.add_parser("cold-start", help="classify responses as cold or warm across idle gaps")
+    cold.add_argument("--actions", default=",".join(ACTIONS), help="comma-separated actions")
+    cold.add_argument("--gaps", default="0,60,300,900",
+                      help="comma-separated idle gaps in seconds before each round")
+    cold.add_argument("--samples", type=int, default=3, help="rounds per idle gap")
+    cold.add_argument("--threshold", type=float, default=2.0,
+                      help="latency multiple of warm median treated as cold when markers are missing")
+
+    mixed = modes.add_parser("contention", help="run actions together at configurable ratios")
+    mixed.add_argument("--mix", default="market_scan=1,batch_analyze:high=2,analyze=4,market_overview=1",
+                       help="comma-separated class=weight; class is action or action:priority")
+    mixed.add_argument("--requests", type=int, default=40, help="total requests in the mixed run")
+    mixed.add_argument("--concurrency", type=int, default=8, help="concurrent requests / pooled connections")
+    mixed.add_argument("--solo-samples", type=int, default=2,
+                       help="sequential requests per class for the slowdown baseline (0 to skip)")
+    mixed.add_argument("--spoof-ip", action="store_true",
+                       help="unique X-Forwarded-For per request to get past the webhook limiter (local only)")
+    mixed.add_argument("--batch-size", type=batch_size, default=25,
+                       help=f"symbols per batch_analyze request (1-{MAX_BATCH_SYMBOLS}; "
+                            f"waits only happen above 10)")
+
+    args = parser.parse_args()
+
+    if not WEBHOOK_SECRET:
+        print(f"{Colors.RED}✗ N8N_WEBHOOK_SECRET is not set{Colors.RESET}")
+        return False
+
+    if args.timeout <= 0:
+        print(f"{Colors.RED}✗ --timeout must be positive, got {args.timeout}{Colors.RESET}")
+        return False
+
+    if args.mode == "cold-start":
+        actions = parse_list(args.actions)
+        unknown = [action for action in actions if action not in ACTIONS]
+        if not actions or unknown:
+            print(f"{Colors.RED}✗ --actions must be from {', '.join(ACTIONS)}, "
+                  f"got '{args.actions}'{Colors.RESET}")
+            return False
+        try:
+            gaps = [float(g) for g in parse_list(args.gaps)]
+        except ValueError:
+            gaps = []
+        if not gaps or min(gaps) < 0:
+            print(f"{Colors.RED}✗ --gaps must be non-negative seconds, got '{args.gaps}'{Colors.RESET}")
+            return False
+        if args.samples < 1:
+            print(f"{Colors.RED}✗ --samples must be a positive integer, got {args.samples}{Colors.RESET}")
+            return False
+        return run_cold_start(args, actions, gaps)
+    if args.mode == "contention":
+        try:
+            mix = parse_mix(args.mix)
+        except ValueError as e:
+            print(f"{Colors.RED}✗ --mix: {e}{Colors.RESET}")
+            return False
+        for flag, value, minimum in (("--requests", args.requests, 1),
+                                     ("--concurrency", args.concurrency, 1),
+                                     ("--solo-samples", args.solo_samples, 0)):
+            if value < minimum:
+                print(f"{Colors.RED}✗ {flag} must be at least {minimum}, got {value}{Colors.RESET}")
+                return False
+        return run_contention(args, mix)
+    return False
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -2,13 +2,21 @@
 """
 THub V2 n8n Workflow Testing Script
 Comprehensive testing for all production workflows
+
+Usage:
+    python3 test-workflows.py             # scripted production tests
+    python3 test-workflows.py --discover  # every webhook found in workflows/, concurrently
 """
 
 import requests
 import json
 import time
+import statistics
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Tuple
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+from requests.adapters import HTTPAdapter
 
 # ANSI color codes
 class Colors:
@@ -21,6 +29,12 @@ class Colors:
 # n8n webhook base URL
 N8N_BASE_URL = "https://n8n.anikamaher.com/webhook"
 
+# Workflow sources and payload registry used by --discover
+N8N_DIR = Path(__file__).resolve().parent
+WORKFLOWS_DIR = N8N_DIR / "workflows"
+FIXTURES_FILE = N8N_DIR / "test-payloads" / "webhook-fixtures.json"
+WEBHOOK_NODE_TYPE = "n8n-nodes-base.webhook"
+
 def test_simple_webhook() -> Tuple[bool, Dict]:
     """Test the simple webhook endpoint"""
     print(f"\n{Colors.BLUE}Test 1: Simple Webhook Test{Colors.RESET}")
@@ -213,6 +227,163 @@ def show_scheduled_workflows():
     print("   - Identifies signals needing refresh")
     print("   - Can be manually triggered in n8n UI")
 
+def discover_webhooks(workflows_dir: Path = WORKFLOWS_DIR) -> Tuple[List[Dict], List[str]]:
+    """Scan workflow JSON for webhook nodes, grouped by (method, path)
+
+    Returns the endpoint list and a list of files that could not be parsed.
+    Workflow variants (production, fixed, DEPLOY, ...) usually share a path,
+    so each endpoint keeps every workflow file that declares it.
+    """
+    endpoints: Dict[Tuple[str, str], Dict] = {}
+    skipped = []
+
+    for workflow_file in sorted(workflows_dir.glob("**/*.json")):
+        relative = str(workflow_file.relative_to(workflows_dir))
+        try:
+            workflow = json.loads(workflow_file.read_text())
+        except (OSError, ValueError) as e:
+            skipped.append(f"{relative} ({e})")
+            continue
+
+        if not isinstance(workflow, dict):
+            continue
+
+        for node in workflow.get("nodes", []):
+            if node.get("type") != WEBHOOK_NODE_TYPE:
+                continue
+
+            params = node.get("parameters", {})
+            path = (params.get("path") or node.get("webhookId") or "").strip("/")
+            if not path:
+                continue
+
+            # n8n defaults the webhook node to GET when httpMethod is unset
+            method = params.get("httpMethod", "GET").upper()
+            endpoint = endpoints.setdefault((method, path), {
+                "method": method,
+                "path": path,
+                "sources": []
+            })
+            endpoint["sources"].append(relative)
+
+    return sorted(endpoints.values(), key=lambda e: (e["path"], e["method"])), skipped
+
+def load_fixtures(fixtures_file: Path = FIXTURES_FILE) -> Dict:
+    """Load the payload registry for discovered webhooks"""
+    with open(fixtures_file) as f:
+        return json.load(f)
+
+def build_payload(path: str, registry: Dict) -> Dict:
+    """Resolve the payload for a webhook path, filling in {{now}} placeholders"""
+    template = registry.get("fixtures", {}).get(path, registry.get("default", {}))
+    now = datetime.utcnow().isoformat() + "Z"
+
+    def resolve(value: Any) -> Any:
+        if value == "{{now}}":
+            return now
+        if isinstance(value, dict):
+            return {k: resolve(v) for k, v in value.items()}
+        if isinstance(value, list):
+            return [resolve(v) for v in value]
+        return value
+
+    return resolve(template)
+
+def create_session(pool_size: int) -> requests.Session:
+    """Create a session whose connection pool matches the worker count"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+def hit_endpoint(session: requests.Session, base_url: str, endpoint: Dict,
+                 payload: Dict, timeout: float) -> Dict:
+    """Send one request to a discovered webhook and time it"""
+    url = f"{base_url}/{endpoint['path']}"
+    start = time.perf_counter()
+
+    try:
+        if endpoint["method"] == "GET":
+            response = session.get(url, params={"test": "discovered"}, timeout=timeout)
+        else:
+            response = session.request(endpoint["method"], url, json=payload, timeout=timeout)
+        status = response.status_code
+    except requests.RequestException as e:
+        status = type(e).__name__
+
+    return {
+        "method": endpoint["method"],
+        "path": endpoint["path"],
+        "status": status,
+        "latency": time.perf_counter() - start
+    }
+
+def run_discovered_smoke(base_url: str = N8N_BASE_URL, repeat: int = 1,
+                         workers: int = 8, timeout: float = 20) -> bool:
+    """Hit every discovered webhook concurrently and print a latency/status matrix"""
+    print(f"{Colors.BLUE}{'=' * 60}")
+    print("THub V2 n8n Webhook Discovery Smoke Run")
+    print('=' * 60 + Colors.RESET)
+
+    endpoints, skipped = discover_webhooks()
+    registry = load_fixtures()
+
+    print(f"Scanned: {WORKFLOWS_DIR}")
+    print(f"Discovered {len(endpoints)} webhook endpoint(s)")
+    for file_name in skipped:
+        print(f"{Colors.YELLOW}! Skipped unparseable workflow: {file_name}{Colors.RESET}")
+
+    if not endpoints:
+        print(f"{Colors.RED}✗ No webhook nodes found{Colors.RESET}")
+        return False
+
+    for path in sorted({endpoint["path"] for endpoint in endpoints}):
+        if path not in registry.get("fixtures", {}):
+            print(f"{Colors.YELLOW}! No fixture for '{path}', using default payload{Colors.RESET}")
+
+    jobs = [(endpoint, build_payload(endpoint["path"], registry))
+            for endpoint in endpoints for _ in range(repeat)]
+
+    session = create_session(workers)
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(
+            lambda job: hit_endpoint(session, base_url, job[0], job[1], timeout), jobs
+        ))
+    wall_time = time.perf_counter() - started
+    session.close()
+
+    # Per-endpoint matrix
+    print(f"\n{Colors.BLUE}{'=' * 60}")
+    print("Latency / Status Matrix (seconds)")
+    print('=' * 60 + Colors.RESET)
+    print(f"{'METHOD':<7}{'PATH':<26}{'STATUS':<14}{'MIN':>8}{'P50':>8}{'MAX':>8}  SOURCES")
+
+    all_ok = True
+    for endpoint in endpoints:
+        samples = [r for r in results
+                   if (r["method"], r["path"]) == (endpoint["method"], endpoint["path"])]
+        latencies = [r["latency"] for r in samples]
+        statuses: Dict[str, int] = {}
+        for r in samples:
+            statuses[str(r["status"])] = statuses.get(str(r["status"]), 0) + 1
+
+        ok = all(isinstance(r["status"], int) and 200 <= r["status"] < 300 for r in samples)
+        all_ok = all_ok and ok
+        color = Colors.GREEN if ok else Colors.RED
+        status_text = ",".join(f"{code}x{count}" for code, count in sorted(statuses.items()))
+
+        print(f"{endpoint['method']:<7}{endpoint['path']:<26}"
+              f"{color}{status_text:<14}{Colors.RESET}"
+              f"{min(latencies):>8.3f}{statistics.median(latencies):>8.3f}{max(latencies):>8.3f}"
+              f"  {len(endpoint['sources'])} workflow(s)")
+        for source in endpoint["sources"]:
+            print(f"{'':<33}- {source}")
+
+    print(f"\nRequests: {len(results)}  Workers: {workers}  Wall time: {wall_time:.3f}s")
+    return all_ok
+
 def main():
     """Run all tests"""
     print(f"{Colors.BLUE}{'=' * 60}")
@@ -266,6 +437,25 @@ def main():
     return successful == len(results)
 
 if __name__ == "__main__":
+    import argparse
     import sys
-    success = main()
+
+    parser = argparse.ArgumentParser(description="THub V2 n8n workflow tests")
+    parser.add_argument("--discover", action="store_true",
+                        help="discover webhook nodes in n8n/workflows and hit them all concurrently")
+    parser.add_argument("--base-url", default=N8N_BASE_URL, help="webhook base URL")
+    parser.add_argument("--repeat", type=int, default=1, help="requests per discovered endpoint")
+    parser.add_argument("--workers", type=int, default=8, help="concurrent workers / pooled connections")
+    parser.add_argument("--timeout", type=float, default=20, help="per-request timeout in seconds")
+    args = parser.parse_args()
+
+    if args.discover:
+        for flag, value in (("--repeat", args.repeat), ("--workers", args.workers),
+                            ("--timeout", args.timeout)):
+            if value <= 0:
+                print(f"{Colors.RED}✗ {flag} must be positive, got {value}{Colors.RESET}")
+                sys.exit(1)
+        success = run_discovered_smoke(args.base_url, args.repeat, args.workers, args.timeout)
+    else:
+        success = main()
     sys.exit(0 if success else 1)
\ No newline at end of file
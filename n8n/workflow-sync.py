@@ -0,0 +1,399 @@
+#!/usr/bin/env python3
+"""
+THub V2 n8n Workflow Sync
+Content-hash dedup of workflow variants and incremental deploy
+
+Usage:
+    python3 workflow-sync.py dedup                         # which variants are really the same
+    python3 workflow-sync.py deploy production/*.json      # push only changed workflows
+    python3 workflow-sync.py deploy --local ./n8n-standin deploy-ready/*.json
+
+Deploy reads N8N_API_URL and N8N_API_KEY (see SETUP-N8N-API-CONNECTION.md).
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# ANSI color codes
+class Colors:
+    GREEN = '\033[92m'
+    RED = '\033[91m'
+    YELLOW = '\033[93m'
+    BLUE = '\033[94m'
+    RESET = '\033[0m'
+
+WORKFLOWS_DIR = Path(__file__).resolve().parent / "workflows"
+
+N8N_API_URL = os.environ.get("N8N_API_URL", "")
+N8N_API_KEY = os.environ.get("N8N_API_KEY", "")
+
+# Fields that change on every export/import without changing behaviour
+VOLATILE_WORKFLOW_KEYS = {
+    "id", "versionId", "meta", "active", "tags", "pinData", "staticData",
+    "createdAt", "updatedAt", "triggerCount", "shared", "isArchived"
+}
+VOLATILE_NODE_KEYS = {"id", "position", "webhookId"}
+
+# Fields the n8n public API accepts on create/update
+DEPLOY_KEYS = ("name", "nodes", "connections", "settings")
+
+# ---------------------------------------------------------------------------
+# Canonicalization and hashing
+# ---------------------------------------------------------------------------
+
+def canonical_node(node: Dict) -> Dict:
+    """Node without IDs, canvas position or credential IDs"""
+    node = {k: v for k, v in node.items() if k not in VOLATILE_NODE_KEYS}
+    if "credentials" in node:
+        node["credentials"] = {
+            kind: {k: v for k, v in cred.items() if k != "id"} if isinstance(cred, dict) else cred
+            for kind, cred in node["credentials"].items()
+        }
+    return node
+
+def canonical_workflow(workflow: Dict) -> Dict:
+    """Workflow content that determines behaviour
+
+    The name is left out so renamed variants (PRODUCTION, DEPLOY, fixed)
+    of the same logic hash equal. Nodes are ordered by name because n8n
+    connections reference nodes by name, not by position in the list.
+    """
+    canonical = {
+        k: v for k, v in workflow.items()
+        if k not in VOLATILE_WORKFLOW_KEYS and k != "name"
+    }
+    canonical["nodes"] = sorted(
+        (canonical_node(node) for node in workflow.get("nodes", [])),
+        key=lambda node: node.get("name", "")
+    )
+    canonical.setdefault("connections", {})
+    canonical.setdefault("settings", {})
+    return canonical
+
+def content_hash(value) -> str:
+    """Stable short hash of JSON-serializable content"""
+    encoded = json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:16]
+
+def hash_workflow(workflow: Dict) -> Tuple[str, Dict[str, str]]:
+    """Return the whole-workflow hash and a per-node hash map keyed by node name"""
+    canonical = canonical_workflow(workflow)
+    node_hashes = {node.get("name", ""): content_hash(node) for node in canonical["nodes"]}
+    return content_hash(canonical), node_hashes
+
+def load_workflows(patterns: List[str]) -> Tuple[List[Dict], List[str]]:
+    """Load workflow files matching glob patterns under workflows/"""
+    files = sorted({path for pattern in patterns for path in WORKFLOWS_DIR.glob(pattern)})
+    loaded = []
+    skipped = []
+
+    for path in files:
+        relative = str(path.relative_to(WORKFLOWS_DIR))
+        try:
+            workflow = json.loads(path.read_text())
+        except (OSError, ValueError) as e:
+            skipped.append(f"{relative} ({e})")
+            continue
+        if not isinstance(workflow, dict) or "nodes" not in workflow:
+            continue
+
+        workflow_hash, node_hashes = hash_workflow(workflow)
+        loaded.append({
+            "file": relative,
+            "name": workflow.get("name", path.stem),
+            "workflow": workflow,
+            "hash": workflow_hash,
+            "nodes": node_hashes
+        })
+
+    return loaded, skipped
+
+# ---------------------------------------------------------------------------
+# Dedup report
+# ---------------------------------------------------------------------------
+
+def node_similarity(a: Dict[str, str], b: Dict[str, str]) -> float:
+    """Jaccard similarity of two workflows' (name, hash) node sets"""
+    left, right = set(a.items()), set(b.items())
+    union = left | right
+    return len(left & right) / len(union) if union else 1.0
+
+def run_dedup(args: argparse.Namespace) -> bool:
+    """Group identical variants and list near-duplicates with their differing nodes"""
+    print(f"{Colors.BLUE}{'=' * 60}")
+    print("THub V2 Workflow Variant Dedup")
+    print('=' * 60 + Colors.RESET)
+
+    workflows, skipped = load_workflows(args.patterns)
+    for file_name in skipped:
+        print(f"{Colors.YELLOW}! Skipped unparseable workflow: {file_name}{Colors.RESET}")
+
+    groups: Dict[str, List[Dict]] = {}
+    for wf in workflows:
+        groups.setdefault(wf["hash"], []).append(wf)
+
+    print(f"Workflows: {len(workflows)}  Distinct contents: {len(groups)}")
+
+    print(f"\n{Colors.BLUE}Identical variants{Colors.RESET}")
+    identical = [group for group in groups.values() if len(group) > 1]
+    if not identical:
+        print("  (none)")
+    for group in identical:
+        print(f"  {Colors.GREEN}{group[0]['hash']}{Colors.RESET}")
+        for wf in group:
+            print(f"    - {wf['file']}  ({wf['name']})")
+
+    print(f"\n{Colors.BLUE}Near duplicates (node similarity >= {args.threshold:.0%}){Colors.RESET}")
+    representatives = [group[0] for group in groups.values()]
+    found = False
+    for i, left in enumerate(representatives):
+        for right in representatives[i + 1:]:
+            similarity = node_similarity(left["nodes"], right["nodes"])
+            if similarity < args.threshold:
+                continue
+            found = True
+            changed = sorted(
+                name for name in set(left["nodes"]) | set(right["nodes"])
+                if left["nodes"].get(name) != right["nodes"].get(name)
+            )
+            print(f"  {similarity:>4.0%}  {left['file']}  <->  {right['file']}")
+            for name in changed:
+                marker = ("changed" if name in left["nodes"] and name in right["nodes"]
+                          else "only in " + (left["file"] if name in left["nodes"] else right["file"]))
+                print(f"          {Colors.YELLOW}~{Colors.RESET} {name} ({marker})")
+    if not found:
+        print("  (none)")
+
+    return True
+
+# ---------------------------------------------------------------------------
+# Incremental deploy
+# ---------------------------------------------------------------------------
+
+class N8nTarget:
+    """n8n public API (/api/v1/workflows)"""
+
+    def __init__(self, api_url: str, api_key: str, pool_size: int, timeout: float):
+        self.base = api_url.rstrip("/") + "/api/v1"
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({
+            "X-N8N-API-KEY": api_key,
+            "Accept": "application/json"
+        })
+
+    def list_workflows(self) -> List[Dict]:
+        """All remote workflows (follows cursor pagination)"""
+        remote = []
+        cursor = None
+        while True:
+            params = {"limit": 250}
+            if cursor:
+                params["cursor"] = cursor
+            response = self.session.get(f"{self.base}/workflows", params=params, timeout=self.timeout)
+            response.raise_for_status()
+            data = response.json()
+            remote.extend(data.get("data", []))
+            cursor = data.get("nextCursor")
+            if not cursor:
+                return remote
+
+    def create(self, body: Dict) -> str:
+        response = self.session.post(f"{self.base}/workflows", json=body, timeout=self.timeout)
+        response.raise_for_status()
+        return response.json().get("id", "")
+
+    def update(self, workflow_id: str, body: Dict) -> str:
+        response = self.session.put(f"{self.base}/workflows/{workflow_id}", json=body,
+                                    timeout=self.timeout)
+        response.raise_for_status()
+        return workflow_id
+
+    def close(self) -> None:
+        self.session.close()
+
+class LocalTarget:
+    """Directory stand-in for an n8n instance: one <id>.json per workflow"""
+
+    def __init__(self, directory: str):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def list_workflows(self) -> List[Dict]:
+        return [json.loads(path.read_text()) for path in sorted(self.directory.glob("*.json"))]
+
+    def create(self, body: Dict) -> str:
+        workflow_id = content_hash([body["name"], time.time()])
+        self.update(workflow_id, body)
+        return workflow_id
+
+    def update(self, workflow_id: str, body: Dict) -> str:
+        path = self.directory / f"{workflow_id}.json"
+        path.write_text(json.dumps({**body, "id": workflow_id}, indent=2))
+        return workflow_id
+
+    def close(self) -> None:
+        pass
+
+def deploy_body(workflow: Dict) -> Dict:
+    """Strip a workflow file down to what the n8n API accepts"""
+    body = {key: workflow[key] for key in DEPLOY_KEYS if key in workflow}
+    body.setdefault("connections", {})
+    body.setdefault("settings", {})
+    return body
+
+def plan_deploy(local: List[Dict], remote: List[Dict]) -> List[Dict]:
+    """Decide create / update / unchanged / skipped for each local workflow
+
+    n8n allows several workflows with the same name; such names are skipped
+    because there is no telling which workflow ID a file should update.
+    """
+    plan = []
+    by_name: Dict[str, Dict] = {}
+    remote_by_name: Dict[str, List[Dict]] = {}
+    for workflow in remote:
+        remote_by_name.setdefault(workflow.get("name", ""), []).append(workflow)
+
+    for wf in local:
+        if wf["name"] in by_name:
+            print(f"{Colors.YELLOW}! '{wf['name']}' is defined by both {by_name[wf['name']]['file']} "
+                  f"and {wf['file']}; keeping the first{Colors.RESET}")
+            continue
+        by_name[wf["name"]] = wf
+
+        matches = remote_by_name.get(wf["name"], [])
+        if len(matches) > 1:
+            ids = ", ".join(str(match.get("id")) for match in matches)
+            print(f"{Colors.YELLOW}! '{wf['name']}' matches {len(matches)} workflows on the target "
+                  f"({ids}); skipping {wf['file']}{Colors.RESET}")
+            plan.append({**wf, "action": "skipped", "remote_id": None})
+            continue
+
+        existing = matches[0] if matches else None
+        if existing is None:
+            action = "create"
+        elif hash_workflow(existing)[0] != wf["hash"]:
+            action = "update"
+        else:
+            action = "unchanged"
+        plan.append({**wf, "action": action, "remote_id": existing.get("id") if existing else None})
+
+    return plan
+
+def apply_step(target, step: Dict) -> Dict:
+    """Upload one workflow and time it"""
+    start = time.perf_counter()
+    body = deploy_body(step["workflow"])
+    try:
+        if step["action"] == "create":
+            step["remote_id"] = target.create(body)
+        else:
+            target.update(step["remote_id"], body)
+        step["error"] = None
+    except (requests.RequestException, OSError) as e:
+        step["error"] = str(e)
+    step["latency"] = time.perf_counter() - start
+    return step
+
+def run_deploy(args: argparse.Namespace) -> bool:
+    """Upload only workflows whose canonical hash differs from the target"""
+    print(f"{Colors.BLUE}{'=' * 60}")
+    print("THub V2 Incremental Workflow Deploy")
+    print('=' * 60 + Colors.RESET)
+
+    local, skipped = load_workflows(args.patterns)
+    for file_name in skipped:
+        print(f"{Colors.YELLOW}! Skipped unparseable workflow: {file_name}{Colors.RESET}")
+
+    if args.local:
+        target = LocalTarget(args.local)
+        print(f"Target: local stand-in {args.local}")
+    else:
+        if not N8N_API_URL or not N8N_API_KEY:
+            print(f"{Colors.RED}✗ N8N_API_URL and N8N_API_KEY must be set (or use --local){Colors.RESET}")
+            return False
+        target = N8nTarget(N8N_API_URL, N8N_API_KEY, args.workers, args.timeout)
+        print(f"Target: {N8N_API_URL}")
+
+    try:
+        try:
+            remote = target.list_workflows()
+        except (requests.RequestException, OSError, ValueError) as e:
+            print(f"{Colors.RED}✗ Could not list workflows on the target: {e}{Colors.RESET}")
+            return False
+        plan = plan_deploy(local, remote)
+        pending = [step for step in plan if step["action"] in ("create", "update")]
+        skipped_names = sum(1 for step in plan if step["action"] == "skipped")
+
+        for step in plan:
+            color = Colors.GREEN if step["action"] == "unchanged" else Colors.YELLOW
+            print(f"  {color}{step['action']:<10}{Colors.RESET}{step['hash']}  {step['file']}")
+
+        if args.dry_run or not pending:
+            print(f"\n{len(pending)} of {len(plan)} workflow(s) need deploying"
+                  + (" (dry run)" if args.dry_run else ""))
+            return True
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.workers) as pool:
+            results = list(pool.map(lambda step: apply_step(target, step), pending))
+        wall_time = time.perf_counter() - started
+    finally:
+        target.close()
+
+    print(f"\n{Colors.BLUE}Uploads{Colors.RESET}")
+    for step in results:
+        if step["error"]:
+            print(f"  {Colors.RED}✗ {step['action']:<8}{Colors.RESET}{step['file']}: {step['error']}")
+        else:
+            print(f"  {Colors.GREEN}✓ {step['action']:<8}{Colors.RESET}{step['file']} "
+                  f"-> {step['remote_id']} ({step['latency']:.3f}s)")
+
+    failed = sum(1 for step in results if step["error"])
+    print(f"\nDeployed: {len(results) - failed}  Failed: {failed}  "
+          f"Unchanged: {len(plan) - len(pending) - skipped_names}  Skipped: {skipped_names}  "
+          f"Wall time: {wall_time:.3f}s")
+    return failed == 0
+
+def main() -> bool:
+    parser = argparse.ArgumentParser(description="THub V2 n8n workflow dedup and incremental deploy")
+    modes = parser.add_subparsers(dest="mode", required=True)
+
+    dedup = modes.add_parser("dedup", help="report identical and near-duplicate workflow variants")
+    dedup.add_argument("patterns", nargs="*", default=["**/*.json"],
+                       help="glob patterns relative to n8n/workflows")
+    dedup.add_argument("--threshold", type=float, default=0.5,
+                       help="minimum node similarity to report a near-duplicate pair")
+
+    deploy = modes.add_parser("deploy", help="deploy workflows whose content changed")
+    deploy.add_argument("patterns", nargs="*", default=["production/*.json"],
+                        help="glob patterns relative to n8n/workflows")
+    deploy.add_argument("--local", metavar="DIR", help="deploy to a directory stand-in instead of n8n")
+    deploy.add_argument("--workers", type=int, default=4, help="concurrent uploads")
+    deploy.add_argument("--timeout", type=float, default=30, help="per-request timeout in seconds")
+    deploy.add_argument("--dry-run", action="store_true", help="show the plan without uploading")
+
+    args = parser.parse_args()
+
+    if args.mode == "dedup":
+        return run_dedup(args)
+    if args.mode == "deploy":
+        return run_deploy(args)
+    return False
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
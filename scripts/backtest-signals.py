@@ -0,0 +1,620 @@
+#!/usr/bin/env python3
+"""
+THub V2 Signal Backtest
+Replays the market scan -> technical -> convergence pipeline over a local
+historical EOD store and tracks forward returns for every emitted signal
+
+Usage:
+    python3 scripts/backtest-signals.py data/eod-us --start 2021-01-01 --end 2024-12-31
+    python3 scripts/backtest-signals.py data/eod-us --weights technical=0.4,sentiment=0.3,liquidity=0.3
+
+Store layout: one bulk EOD file per trading day, as returned by
+EODHDService.getBulkEOD(exchange, date) - <store>/YYYY-MM-DD.json (list of
+{code, open, high, low, close, adjusted_close, volume, ...}) or
+YYYY-MM-DD.csv with the same columns (EODHD's Code,Open,High,Low,Close,
+Adjusted_close,Volume headers also work).
+
+Indicators, the trend/momentum rules and forward returns use adjusted_close
+so splits and dividends do not show up as price moves; fetch the whole
+store in one pass so the adjustment basis is consistent. The price and
+volume prefilter uses the raw close and volume, as the live scan does.
+Files without adjusted_close fall back to the raw close.
+
+Model parity with src/lib/services:
+- Prefilter and opportunity score: AnalysisCoordinator.scanMarket
+- Technical score: TechnicalAnalysisService.calculateTechnicalScore, with
+  RSI(14, Wilder), SMA20 and SMA50 computed from the store instead of EODHD
+- Convergence and strength: ScoringService (signal at >= 70)
+The sentiment and liquidity layers need intraday and real-time data that an
+EOD store does not have, so they are scored at 50, the same neutral value
+those services return when their data is unavailable. With the live 40/30/30
+weights that pins the score to 0.4 * technical + 30, so by default their
+weight is folded into the technical layer (technical=1). Passing --weights
+scores the layers as given and warns about strength buckets it cannot reach.
+"""
+
+import argparse
+import csv
+import heapq
+import json
+import math
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# ANSI color codes
+class Colors:
+    GREEN = '\033[92m'
+    RED = '\033[91m'
+    YELLOW = '\033[93m'
+    BLUE = '\033[94m'
+    RESET = '\033[0m'
+
+# Defaults mirror WebhookSchema.filters in src/app/api/webhooks/n8n/route.ts
+DEFAULT_FILTERS = {
+    "minVolume": 1000000,
+    "minPrice": 5,
+    "maxPrice": 500,
+    "minDailyChange": 2,
+    "limit": 30
+}
+
+# ScoringService defaults
+SCORING_WEIGHTS = {"technical": 0.4, "sentiment": 0.3, "liquidity": 0.3}
+SIGNAL_THRESHOLD = 70
+# Only the technical layer is modeled, so it carries all the weight by default
+DEFAULT_WEIGHTS = {"technical": 1.0, "sentiment": 0.0, "liquidity": 0.0}
+NEUTRAL_SCORE = 50
+
+# Longest lookback is SMA50; extra days let Wilder RSI settle
+WARMUP_DAYS = 120
+DEFAULT_HORIZONS = [1, 5, 10, 20]
+
+# ---------------------------------------------------------------------------
+# Scoring model (ported from the TypeScript services)
+# ---------------------------------------------------------------------------
+
+def passes_prefilter(bar: Dict, filters: Dict) -> bool:
+    """AnalysisCoordinator.scanMarket filter step"""
+    if not bar["volume"]:
+        return False
+    if filters.get("minVolume") and bar["volume"] < filters["minVolume"]:
+        return False
+    if filters.get("minPrice") and bar["close"] < filters["minPrice"]:
+        return False
+    if filters.get("maxPrice") and bar["close"] > filters["maxPrice"]:
+        return False
+    if filters.get("minDailyChange"):
+        if not bar["open"]:
+            return False
+        intraday_change = (bar["close"] - bar["open"]) / bar["open"] * 100
+        if abs(intraday_change) < filters["minDailyChange"]:
+            return False
+    return True
+
+def opportunity_score(bar: Dict) -> int:
+    """AnalysisCoordinator.calculateOpportunityScore"""
+    score = 0.0
+    # Same placeholder as the TS code: average volume assumed to be 80% of today's
+    estimated_avg_volume = bar["volume"] * 0.8
+    volume_ratio = bar["volume"] / (estimated_avg_volume or bar["volume"])
+    score += min(volume_ratio * 10, 30)
+
+    change_percent = abs((bar["close"] - bar["open"]) / bar["open"] * 100)
+    score += min(change_percent * 4, 40)
+
+    score += min(bar["close"] * bar["volume"] / 1000000, 30)
+    # JS Math.round rounds halves up
+    return math.floor(score + 0.5)
+
+def technical_score(bar: Dict, previous_close: Optional[float], rsi: Optional[float],
+                    sma20: Optional[float], sma50: Optional[float],
+                    avg_volume: Optional[float]) -> int:
+    """TechnicalAnalysisService.calculateTechnicalScore
+
+    previous_close, rsi and the SMAs are on the adjusted basis, so the
+    comparisons below use the adjusted close.
+    """
+    score = 50
+    close = bar["adjusted_close"]
+    rsi = rsi or 50
+    sma20 = sma20 or close
+    sma50 = sma50 or close
+
+    if close > sma20 > sma50:
+        score += 20
+    elif close < sma20 < sma50:
+        score -= 15
+
+    if rsi < 30:
+        score += 15
+    elif rsi > 70:
+        score -= 10
+    elif 50 < rsi < 60:
+        score += 5
+
+    volume_ratio = bar["volume"] / (avg_volume or 1)
+    if volume_ratio > 2.0:
+        score += 15
+    elif volume_ratio > 1.5:
+        score += 10
+    elif volume_ratio < 0.5:
+        score -= 5
+
+    if previous_close:
+        day_change = (close - previous_close) / previous_close * 100
+        if day_change > 3:
+            score += 10
+        elif day_change < -3:
+            score -= 10
+
+    # Position in the day's range is the same on either basis, so use raw OHLC
+    day_range = bar["high"] - bar["low"]
+    price_position = (bar["close"] - bar["low"]) / day_range if day_range > 0 else 0.5
+    if price_position > 0.8:
+        score += 5
+    elif price_position < 0.2:
+        score -= 5
+
+    return max(0, min(100, score))
+
+def convergence(technical: float, weights: Dict[str, float]) -> Tuple[int, str]:
+    """ScoringService.calculateConvergence with neutral sentiment and liquidity"""
+    weighted = (technical * weights["technical"]
+                + NEUTRAL_SCORE * weights["sentiment"]
+                + NEUTRAL_SCORE * weights["liquidity"])
+    score = math.floor(weighted + 0.5)
+
+    if score >= 80:
+        strength = "VERY_STRONG"
+    elif score >= 70:
+        strength = "STRONG"
+    elif score >= 60:
+        strength = "MODERATE"
+    else:
+        strength = "WEAK"
+    return score, strength
+
+def unreachable_strengths(weights: Dict[str, float], threshold: int) -> List[str]:
+    """Warnings for signal/strength levels the neutral layers put out of reach"""
+    best, _ = convergence(100, weights)
+    warnings = []
+    if best < threshold:
+        warnings.append(f"no signal can reach the threshold of {threshold} "
+                        f"(best possible score is {best})")
+        return warnings
+
+    needed = next(t for t in range(101) if convergence(t, weights)[0] >= threshold)
+    if needed >= 90:
+        warnings.append(f"a signal needs a technical score of at least {needed}")
+    for strength, floor in (("VERY_STRONG", 80), ("STRONG", 70), ("MODERATE", 60)):
+        if floor >= threshold and best < floor:
+            warnings.append(f"{strength} (>= {floor}) is unreachable (best possible score is {best})")
+    return warnings
+
+# ---------------------------------------------------------------------------
+# Per-symbol indicator state (O(1) memory per symbol)
+# ---------------------------------------------------------------------------
+
+class SymbolState:
+    """Rolling closes/volumes plus incremental Wilder RSI(14)"""
+
+    __slots__ = ("closes", "volumes", "close_sum20", "close_sum50",
+                 "avg_gain", "avg_loss", "rsi_seed", "pending", "last_seen")
+
+    def __init__(self):
+        self.closes: deque = deque(maxlen=50)
+        self.volumes: deque = deque(maxlen=20)
+        self.close_sum20 = 0.0
+        self.close_sum50 = 0.0
+        self.avg_gain: Optional[float] = None
+        self.avg_loss: Optional[float] = None
+        self.rsi_seed: List[float] = []
+        # Open signals waiting for forward returns: [record, entry adjusted close, bars_elapsed]
+        self.pending: List[list] = []
+        # Index of the last day in the range that had a bar for this symbol
+        self.last_seen = -1
+
+    def previous_close(self) -> Optional[float]:
+        return self.closes[-1] if self.closes else None
+
+    def sma(self, period: int) -> Optional[float]:
+        if len(self.closes) < period:
+            return None
+        return (self.close_sum20 if period == 20 else self.close_sum50) / period
+
+    def rsi(self) -> Optional[float]:
+        if self.avg_gain is None:
+            return None
+        if self.avg_loss == 0:
+            return 100.0
+        return 100 - 100 / (1 + self.avg_gain / self.avg_loss)
+
+    def avg_volume(self) -> Optional[float]:
+        return sum(self.volumes) / len(self.volumes) if self.volumes else None
+
+    def update(self, bar: Dict) -> None:
+        close = bar["adjusted_close"]
+        if self.closes:
+            change = close - self.closes[-1]
+            gain, loss = max(change, 0.0), max(-change, 0.0)
+            if self.avg_gain is None:
+                self.rsi_seed.append(change)
+                if len(self.rsi_seed) == 14:
+                    self.avg_gain = sum(max(c, 0.0) for c in self.rsi_seed) / 14
+                    self.avg_loss = sum(max(-c, 0.0) for c in self.rsi_seed) / 14
+                    self.rsi_seed = []
+            else:
+                self.avg_gain = (self.avg_gain * 13 + gain) / 14
+                self.avg_loss = (self.avg_loss * 13 + loss) / 14
+
+        if len(self.closes) >= 20:
+            self.close_sum20 -= self.closes[-20]
+        if len(self.closes) == 50:
+            self.close_sum50 -= self.closes[0]
+        self.closes.append(close)
+        self.close_sum20 += close
+        self.close_sum50 += close
+        self.volumes.append(bar["volume"])
+
+# ---------------------------------------------------------------------------
+# Streaming store reader
+# ---------------------------------------------------------------------------
+
+def list_trading_days(store: Path) -> List[Tuple[str, Path]]:
+    """(YYYY-MM-DD, path) for every day file in the store, in date order"""
+    days = []
+    for path in store.iterdir():
+        if path.suffix not in (".json", ".csv"):
+            continue
+        try:
+            date.fromisoformat(path.stem)
+        except ValueError:
+            continue
+        days.append((path.stem, path))
+    return sorted(days)
+
+def read_day(path: Path) -> Iterator[Dict]:
+    """Yield normalized bars from one bulk EOD file"""
+    if path.suffix == ".json":
+        rows = json.loads(path.read_text())
+    else:
+        handle = open(path, newline="")
+        rows = ({k.lower(): v for k, v in row.items()} for row in csv.DictReader(handle))
+
+    for row in rows:
+        try:
+            close = float(row["close"])
+            adjusted_close = float(row.get("adjusted_close") or 0) or close
+            yield {
+                "code": row["code"],
+                "open": float(row["open"]),
+                "high": float(row["high"]),
+                "low": float(row["low"]),
+                "close": close,
+                "adjusted_close": adjusted_close,
+                "volume": float(row["volume"] or 0)
+            }
+        except (KeyError, TypeError, ValueError):
+            continue
+
+    if path.suffix != ".json":
+        handle.close()
+
+# ---------------------------------------------------------------------------
+# Pipeline
+# ---------------------------------------------------------------------------
+
+class ReturnStats:
+    """Running forward-return aggregates per (strength, horizon)"""
+
+    def __init__(self):
+        self.cells: Dict[Tuple[str, int], List[float]] = {}
+
+    def add(self, strength: str, horizon: int, value: float) -> None:
+        cell = self.cells.setdefault((strength, horizon), [0, 0.0, 0.0, 0])
+        cell[0] += 1
+        cell[1] += value
+        cell[2] += value * value
+        cell[3] += 1 if value > 0 else 0
+
+    def merge(self, other: "ReturnStats") -> None:
+        for key, (n, total, squares, wins) in other.cells.items():
+            cell = self.cells.setdefault(key, [0, 0.0, 0.0, 0])
+            cell[0] += n
+            cell[1] += total
+            cell[2] += squares
+            cell[3] += wins
+
+def emit_signals(day: str, bars: List[Dict], states: Dict[str, SymbolState],
+                 config: Dict) -> Iterator[Dict]:
+    """Market scan prefilter -> top candidates -> technical -> convergence"""
+    candidates = [bar for bar in bars if passes_prefilter(bar, config["filters"])]
+    top = heapq.nlargest(config["filters"]["limit"], candidates, key=opportunity_score)
+
+    for bar in top:
+        state = states.get(bar["code"])
+        if state is None:
+            continue
+        # Indicators are as of the previous close, like a scan run during the session
+        technical = technical_score(bar, state.previous_close(), state.rsi(),
+                                    state.sma(20), state.sma(50), state.avg_volume())
+        score, strength = convergence(technical, config["weights"])
+        if score >= config["threshold"]:
+            yield {
+                "date": day,
+                "symbol": bar["code"],
+                "close": bar["close"],
+                "adjusted_close": bar["adjusted_close"],
+                "technical": technical,
+                "score": score,
+                "strength": strength
+            }
+
+def run_range(task: Tuple[List[Tuple[str, str]], int, int, Dict]) -> Dict:
+    """Worker: replay one date range
+
+    task = (days, first, last, config) where days includes the warmup before
+    `first` and the forward-return tail after `last`; signals are only
+    emitted for days[first:last].
+    """
+    days, first, last, config = task
+    horizons = config["horizons"]
+    max_horizon = max(horizons)
+    states: Dict[str, SymbolState] = {}
+    stats = ReturnStats()
+    signal_count = 0
+    unresolved = 0
+    disappeared = 0
+    writer = None
+    out_handle = None
+
+    if config.get("signals_out"):
+        out_handle = open(f"{config['signals_out']}.{days[first][0]}.part", "w", newline="")
+        writer = csv.writer(out_handle)
+
+    for index, (day, path) in enumerate(days):
+        bars = list(read_day(Path(path)))
+
+        # Resolve forward returns from today's closes before updating state
+        for bar in bars:
+            state = states.get(bar["code"])
+            if state is None or not state.pending:
+                continue
+            still_open = []
+            for entry in state.pending:
+                record, entry_close, elapsed = entry
+                elapsed += 1
+                if elapsed in horizons:
+                    value = (bar["adjusted_close"] - entry_close) / entry_close * 100
+                    record[f"r{elapsed}"] = value
+                    stats.add(record["strength"], elapsed, value)
+                if elapsed < max_horizon:
+                    still_open.append([record, entry_close, elapsed])
+                elif writer:
+                    writer.writerow(format_signal(record, horizons))
+            state.pending = still_open
+
+        if first <= index < last:
+            for record in emit_signals(day, bars, states, config):
+                signal_count += 1
+                states[record["symbol"]].pending.append([record, record["adjusted_close"], 0])
+
+        for bar in bars:
+            state = states.get(bar["code"])
+            if state is None:
+                state = states[bar["code"]] = SymbolState()
+            state.update(bar)
+            state.last_seen = index
+
+    for state in states.values():
+        for record, entry_close, elapsed in state.pending:
+            if state.last_seen == len(days) - 1:
+                # Still trading, but its horizons run past the end of the store
+                unresolved += 1
+            else:
+                # Delisted or halted: hold to the last available close so the
+                # signal is not dropped from the stats (survivorship bias)
+                disappeared += 1
+                value = (state.closes[-1] - entry_close) / entry_close * 100
+                for horizon in horizons:
+                    if horizon > elapsed:
+                        record[f"r{horizon}"] = value
+                        stats.add(record["strength"], horizon, value)
+            if writer:
+                writer.writerow(format_signal(record, horizons))
+
+    if out_handle:
+        out_handle.close()
+
+    return {
+        "range": (days[first][0], days[last - 1][0]),
+        "signals": signal_count,
+        "unresolved": unresolved,
+        "disappeared": disappeared,
+        "stats": stats,
+        "symbols": len(states)
+    }
+
+def format_signal(record: Dict, horizons: List[int]) -> List:
+    return ([record["date"], record["symbol"], record["close"], record["technical"],
+             record["score"], record["strength"]]
+            + [f"{record[f'r{h}']:.4f}" if f"r{h}" in record else "" for h in horizons])
+
+def build_tasks(days: List[Tuple[str, Path]], start: str, end: str, chunk_days: int,
+                config: Dict) -> List[Tuple]:
+    """Split the backtest window into ranges with their warmup and forward tails"""
+    indexes = [i for i, (day, _) in enumerate(days) if start <= day <= end]
+    if not indexes:
+        return []
+
+    tail = max(config["horizons"])
+    tasks = []
+    for chunk_start in range(indexes[0], indexes[-1] + 1, chunk_days):
+        chunk_end = min(chunk_start + chunk_days, indexes[-1] + 1)
+        lo = max(0, chunk_start - WARMUP_DAYS)
+        hi = min(len(days), chunk_end + tail)
+        window = [(day, str(path)) for day, path in days[lo:hi]]
+        tasks.append((window, chunk_start - lo, chunk_end - lo, config))
+    return tasks
+
+def parse_weights(value: str) -> Dict[str, float]:
+    if not value.strip():
+        return dict(DEFAULT_WEIGHTS)
+    # Explicit weights override the live ScoringService ones layer by layer
+    weights = dict(SCORING_WEIGHTS)
+    for item in value.split(","):
+        if item.strip():
+            layer, _, weight = item.partition("=")
+            if layer.strip() not in weights:
+                raise ValueError(f"Unknown layer '{layer}'")
+            weights[layer.strip()] = float(weight)
+    # Same checks as ScoringService.validateWeights
+    if abs(sum(weights.values()) - 1) > 0.001:
+        raise ValueError(f"Weights must sum to 1, got {sum(weights.values())}")
+    for layer, weight in weights.items():
+        if weight < 0 or weight > 1:
+            raise ValueError(f"Weight for '{layer}' must be between 0 and 1, got {weight}")
+    return weights
+
+def print_report(results: List[Dict], horizons: List[int], wall_time: float) -> None:
+    stats = ReturnStats()
+    for result in results:
+        stats.merge(result["stats"])
+
+    print(f"\n{Colors.BLUE}{'=' * 60}")
+    print("Forward Returns by Signal Strength (%)")
+    print('=' * 60 + Colors.RESET)
+    print(f"{'STRENGTH':<13}{'HORIZON':>8}{'N':>8}{'MEAN':>9}{'STDEV':>9}{'HIT RATE':>10}")
+
+    for strength in ("VERY_STRONG", "STRONG", "MODERATE", "WEAK"):
+        for horizon in horizons:
+            cell = stats.cells.get((strength, horizon))
+            if not cell:
+                continue
+            n, total, squares, wins = cell
+            mean = total / n
+            stdev = math.sqrt(max(0.0, squares / n - mean * mean))
+            color = Colors.GREEN if mean > 0 else Colors.RED
+            print(f"{strength:<13}{horizon:>7}d{n:>8}{color}{mean:>9.2f}{Colors.RESET}"
+                  f"{stdev:>9.2f}{wins / n:>9.1%}")
+
+    signals = sum(r["signals"] for r in results)
+    unresolved = sum(r["unresolved"] for r in results)
+    disappeared = sum(r["disappeared"] for r in results)
+    print(f"\nSignals: {signals}  Unresolved at store end: {unresolved}  "
+          f"Ranges: {len(results)}  Wall time: {wall_time:.1f}s")
+    if disappeared:
+        print(f"{Colors.YELLOW}! {disappeared} signal(s) whose symbol disappeared from the store "
+              f"(delisted or halted) were held to its last close{Colors.RESET}")
+
+def main() -> bool:
+    parser = argparse.ArgumentParser(description="THub V2 signal backtest over a local EOD store")
+    parser.add_argument("store", help="directory of per-day bulk EOD files (YYYY-MM-DD.json|csv)")
+    parser.add_argument("--start", default="0000-00-00", help="first signal date (YYYY-MM-DD)")
+    parser.add_argument("--end", default="9999-99-99", help="last signal date (YYYY-MM-DD)")
+    parser.add_argument("--workers", type=int, default=None, help="processes (default: CPU count)")
+    parser.add_argument("--chunk-days", type=int, default=250,
+                        help="trading days per worker range (each range re-reads its warmup)")
+    parser.add_argument("--horizons", default=",".join(map(str, DEFAULT_HORIZONS)),
+                        help="forward-return horizons in trading days")
+    parser.add_argument("--weights", default="",
+                        help="layer weights, e.g. technical=0.4,sentiment=0.3,liquidity=0.3 "
+                             "(default: technical=1, the only modeled layer)")
+    parser.add_argument("--threshold", type=int, default=SIGNAL_THRESHOLD,
+                        help="minimum convergence score for a signal")
+    parser.add_argument("--min-volume", type=float, default=DEFAULT_FILTERS["minVolume"])
+    parser.add_argument("--min-price", type=float, default=DEFAULT_FILTERS["minPrice"])
+    parser.add_argument("--max-price", type=float, default=DEFAULT_FILTERS["maxPrice"])
+    parser.add_argument("--min-daily-change", type=float, default=DEFAULT_FILTERS["minDailyChange"])
+    parser.add_argument("--limit", type=int, default=DEFAULT_FILTERS["limit"],
+                        help="candidates analyzed per day (market scan limit)")
+    parser.add_argument("--signals-out", help="write every signal with its forward returns to this CSV")
+    args = parser.parse_args()
+
+    store = Path(args.store)
+    if not store.is_dir():
+        print(f"{Colors.RED}✗ EOD store not found: {store}{Colors.RESET}")
+        return False
+
+    for flag, value in (("--chunk-days", args.chunk_days), ("--limit", args.limit),
+                        ("--workers", args.workers)):
+        if value is not None and value < 1:
+            print(f"{Colors.RED}✗ {flag} must be a positive integer, got {value}{Colors.RESET}")
+            return False
+
+    try:
+        horizons = sorted({int(h) for h in args.horizons.split(",") if h.strip()})
+    except ValueError:
+        horizons = []
+    if not horizons or horizons[0] < 1:
+        print(f"{Colors.RED}✗ --horizons must be positive trading-day counts, "
+              f"got '{args.horizons}'{Colors.RESET}")
+        return False
+
+    try:
+        weights = parse_weights(args.weights)
+    except ValueError as e:
+        print(f"{Colors.RED}✗ --weights: {e}{Colors.RESET}")
+        return False
+
+    config = {
+        "filters": {
+            "minVolume": args.min_volume,
+            "minPrice": args.min_price,
+            "maxPrice": args.max_price,
+            "minDailyChange": args.min_daily_change,
+            "limit": args.limit
+        },
+        "weights": weights,
+        "threshold": args.threshold,
+        "horizons": horizons,
+        "signals_out": args.signals_out
+    }
+
+    print(f"{Colors.BLUE}{'=' * 60}")
+    print("THub V2 Signal Backtest")
+    print('=' * 60 + Colors.RESET)
+
+    days = list_trading_days(store)
+    tasks = build_tasks(days, args.start, args.end, args.chunk_days, config)
+    if not tasks:
+        print(f"{Colors.RED}✗ No trading days in {store} between {args.start} and {args.end}{Colors.RESET}")
+        return False
+
+    print(f"Store: {store} ({len(days)} trading days)")
+    print(f"Weights: {config['weights']}  Threshold: {args.threshold}  Horizons: {horizons}")
+    print(f"Ranges: {len(tasks)} x {args.chunk_days} days")
+    for warning in unreachable_strengths(weights, args.threshold):
+        print(f"{Colors.YELLOW}! Sentiment and liquidity are fixed at {NEUTRAL_SCORE}: "
+              f"{warning}{Colors.RESET}")
+
+    started = time.perf_counter()
+    results = []
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        for result in pool.map(run_range, tasks):
+            results.append(result)
+            print(f"  {Colors.GREEN}✓{Colors.RESET} {result['range'][0]} .. {result['range'][1]}: "
+                  f"{result['signals']} signal(s), {result['symbols']} symbols")
+    wall_time = time.perf_counter() - started
+
+    if args.signals_out:
+        with open(args.signals_out, "w", newline="") as out:
+            csv.writer(out).writerow(["date", "symbol", "close", "technical", "score", "strength"]
+                                     + [f"return_{h}d" for h in horizons])
+            for task in tasks:
+                part = Path(f"{args.signals_out}.{task[0][task[1]][0]}.part")
+                with open(part) as f:
+                    out.write(f.read())
+                part.unlink()
+
+    print_report(results, horizons, wall_time)
+    return True
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -1,6 +1,8 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { z } from 'zod';
 import { AnalysisCoordinator } from '@/lib/services/analysis-coordinator.service';
+import { getRateLimiter } from '@/lib/services/rate-limiter.service';
+import { CacheFactory } from '@/lib/services/cache-factory';
 import { logger } from '@/lib/logger';
 import { withBodyValidation, validationErrorResponse } from '@/lib/validation/helpers';
 import { stockSymbolSchema } from '@/lib/validation/schemas';
@@ -34,6 +36,17 @@ function checkWebhookRateLimit(clientIp: string): boolean {
   return true;
 }
 
+// Serverless instance markers
+// Module scope survives between invocations on a warm instance, so the first
+// successful request served by each instance is its cold start
+const INSTANCE_ID = crypto.randomUUID();
+const INSTANCE_LOADED_AT = Date.now();
+let instanceInvocations = 0;
+
+function elapsedMs(start: number): number {
+  return Math.round((performance.now() - start) * 100) / 100;
+}
+
 // Webhook request schema
 const WebhookSchema = z.object({
   action: z.enum(['analyze', 'batch_analyze', 'market_overview', 'market_scan']),
@@ -145,11 +158,33 @@ export async function POST(request: NextRequest) {
       priority: validatedData.priority
     });
 
-    // Step 4: Initialize coordinator
+    // Step 4: Initialize shared services and coordinator
+    // Timed separately so cold starts can be attributed to module initialization
+    let initStart = performance.now();
+    getRateLimiter();
+    const rateLimiterInit = elapsedMs(initStart);
+
+    initStart = performance.now();
+    try {
+      await CacheFactory.getInstance();
+    } catch {
+      // Analysis services retry lazily and report configuration errors themselves
+    }
+    const cacheServiceInit = elapsedMs(initStart);
+
+    // Constructs the EODHD clients for every analysis layer
+    initStart = performance.now();
     const coordinator = new AnalysisCoordinator();
+    const initTimings = {
+      rateLimiter: rateLimiterInit,
+      cacheService: cacheServiceInit,
+      coordinator: elapsedMs(initStart)
+    };
     
     // Step 5: Process based on action type
     let response: any;
+    // Rate limiter pressure seen by this request (the limiter is shared by all actions)
+    const rateLimit = { waitTime: 0, denied: 0 };
     
     switch (validatedData.action) {
       case 'analyze':
@@ -166,6 +201,7 @@ export async function POST(request: NextRequest) {
         // Single symbol analysis
         const symbol = validatedData.symbols[0];
         const result = await coordinator.analyzeStock(symbol);
+        if (result.metrics.rateLimited) rateLimit.denied = 1;
         
         response = {
           success: true,
@@ -195,6 +231,8 @@ export async function POST(request: NextRequest) {
         
         // Batch analysis with priority handling
         const batchResult = await coordinator.analyzeBatch(validatedData.symbols);
+        rateLimit.waitTime = batchResult.summary.rateLimitWait;
+        rateLimit.denied = batchResult.summary.rateLimitedSymbols;
         
         response = {
           success: true,
@@ -241,6 +279,7 @@ export async function POST(request: NextRequest) {
         });
         
         const scanResult = await coordinator.scanMarket(validatedData.filters);
+        if (scanResult.rateLimited) rateLimit.denied = 1;
         
         response = {
           success: true,
@@ -285,6 +324,8 @@ export async function POST(request: NextRequest) {
         resetIn: apiStats.daily.resetIn
       },
       approachingLimit: apiStats.isApproachingLimit,
+      request: rateLimit,
+      contention: getRateLimiter().getContentionStats(),
       warningLevel: apiStats.minute.percentage > 80 ? 'high' : 
                    apiStats.minute.percentage > 60 ? 'medium' : 'normal'
     };
@@ -292,6 +333,17 @@ export async function POST(request: NextRequest) {
     // Add execution time
     response.executionTime = Date.now() - startTime;
 
+    // Add instance markers for cold-start measurement
+    // Counted here so rejected requests (429/401/400) cannot consume the cold start
+    const invocation = ++instanceInvocations;
+    response.instance = {
+      id: INSTANCE_ID,
+      coldStart: invocation === 1,
+      invocation,
+      uptime: Date.now() - INSTANCE_LOADED_AT,
+      initTimings
+    };
+
     // Log successful completion
     webhookLogger.info('Webhook processed successfully', {
       requestId,
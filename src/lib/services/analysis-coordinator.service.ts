@@ -17,6 +17,7 @@ export interface AnalysisResult {
     analysisTime: number;
     apiCallsUsed: number;
     cacheHits: number;
+    rateLimited?: boolean;
   };
 }
 
@@ -27,6 +28,8 @@ export interface BatchAnalysisResult {
     signalsCreated: number;
     totalTime: number;
     apiCallsUsed: number;
+    rateLimitWait: number;
+    rateLimitedSymbols: number;
   };
 }
 
@@ -90,7 +93,8 @@ export class AnalysisCoordinator {
           metrics: {
             analysisTime: 0,
             apiCallsUsed: 0,
-            cacheHits: 0
+            cacheHits: 0,
+            rateLimited: true
           }
         };
       }
@@ -181,6 +185,8 @@ export class AnalysisCoordinator {
     const results: AnalysisResult[] = [];
     let totalApiCalls = 0;
     let signalsCreated = 0;
+    let rateLimitWait = 0;
+    let rateLimitedSymbols = 0;
     
     // Process in smaller batches to respect rate limits
     const batchSize = 10;
@@ -198,6 +204,7 @@ export class AnalysisCoordinator {
       
       if (!canProceed) {
         this.logger.warn(`Rate limit reached at batch ${batchNumber}/${totalBatches}`);
+        rateLimitedSymbols += symbols.length - i;
         break;
       }
       
@@ -213,13 +220,12 @@ export class AnalysisCoordinator {
         results.push(result);
         totalApiCalls += result.metrics.apiCallsUsed;
         if (result.signal) signalsCreated++;
+        if (result.metrics.rateLimited) rateLimitedSymbols++;
       });
       
       // Add delay between batches to avoid hitting minute limits
       if (i + batchSize < symbols.length) {
-        const delay = this.rateLimiter.getOptimalDelay();
-        this.logger.debug(`Waiting ${delay}ms before next batch`);
-        await new Promise(resolve => setTimeout(resolve, delay));
+        rateLimitWait += await this.rateLimiter.waitIfNeeded();
       }
     }
     
@@ -238,7 +244,9 @@ export class AnalysisCoordinator {
         totalSymbols: symbols.length,
         signalsCreated,
         totalTime,
-        apiCallsUsed: totalApiCalls
+        apiCallsUsed: totalApiCalls,
+        rateLimitWait,
+        rateLimitedSymbols
       }
     };
   }
@@ -430,7 +438,8 @@ export class AnalysisCoordinator {
           filteredSymbols: 0,
           candidates: [],
           scanTime: 0,
-          scanId
+          scanId,
+          rateLimited: true
         };
       }
       
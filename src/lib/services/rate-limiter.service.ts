@@ -14,6 +14,12 @@ export interface RateLimitStats {
   };
 }
 
+export interface RateLimitContentionStats {
+  deniedChecks: number;
+  waits: number;
+  totalWaitTime: number; // milliseconds
+}
+
 /**
  * Rate limiter for EODHD API calls
  * Tracks both minute and daily limits to prevent API overuse
@@ -24,6 +30,9 @@ export class RateLimiter {
   private dailyCounter = 0;
   private lastMinuteReset = Date.now();
   private lastDailyReset = Date.now();
+  private deniedChecks = 0;
+  private waits = 0;
+  private totalWaitTime = 0;
   private logger = logger.createChild('RateLimiter');
   
   // EODHD API limits for EOD+Intraday plan
@@ -63,6 +72,7 @@ export class RateLimiter {
     
     // Check if we can make the request
     if (this.minuteCounter + apiCalls > safeMinuteLimit) {
+      this.deniedChecks++;
       this.logger.warn('Minute rate limit would be exceeded', {
         current: this.minuteCounter,
         requested: apiCalls,
@@ -72,6 +82,7 @@ export class RateLimiter {
     }
     
     if (this.dailyCounter + apiCalls > safeDailyLimit) {
+      this.deniedChecks++;
       this.logger.warn('Daily rate limit would be exceeded', {
         current: this.dailyCounter,
         requested: apiCalls,
@@ -161,13 +172,29 @@ export class RateLimiter {
 
   /**
    * Wait if necessary to avoid rate limiting
+   * @returns The delay applied in milliseconds
    */
-  async waitIfNeeded(): Promise<void> {
+  async waitIfNeeded(): Promise<number> {
     const delay = this.getOptimalDelay();
     if (delay > 0) {
       this.logger.info(`Rate limit delay: ${delay}ms`);
+      this.waits++;
+      this.totalWaitTime += delay;
       await new Promise(resolve => setTimeout(resolve, delay));
     }
+    return delay;
+  }
+
+  /**
+   * Get denied checks and applied delays since creation (or last reset)
+   * Shared by every caller of the singleton, so useful for spotting contention
+   */
+  getContentionStats(): RateLimitContentionStats {
+    return {
+      deniedChecks: this.deniedChecks,
+      waits: this.waits,
+      totalWaitTime: this.totalWaitTime
+    };
   }
 
   /**
@@ -219,6 +246,9 @@ export class RateLimiter {
     this.dailyCounter = 0;
     this.lastMinuteReset = Date.now();
     this.lastDailyReset = Date.now();
+    this.deniedChecks = 0;
+    this.waits = 0;
+    this.totalWaitTime = 0;
     this.logger.info('Rate limiter reset');
   }
 }
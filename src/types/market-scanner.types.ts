@@ -31,6 +31,7 @@ export interface MarketScanResult {
   candidates: MarketCandidate[];
   scanTime: number;
   scanId?: string;
+  rateLimited?: boolean;
 }
 
 export interface MarketScanQueueEntry {